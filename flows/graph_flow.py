@@ -2,6 +2,7 @@ from prefect import flow, task
 from src.shared.pipeline_definitions import EndpointResponse, PipelineStages, PipelineState
 from src.shared.flow_processor import FlowProcessor
 from src.utils.logging_utils import get_logger
+from src.graph.config import graph_config
 from src.graph.graph_endpoint import GraphEndpoint
 from pathlib import Path
 
@@ -22,7 +23,8 @@ def graph_flow() -> None:
     processor = FlowProcessor(flow_name)
     processor.process_items(
         stage=PipelineStages.GRAPH,
-        task_func=graph_item
+        task_func=graph_item,
+        max_concurrency=graph_config.MAX_WORKERS,
     )
     logger.info(f"Completed {flow_name}")
 
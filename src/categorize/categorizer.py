@@ -1,15 +1,16 @@
 """Categorizes pre-extracted entity data into structured topics, claims, and sentiment."""
 
-import json
 from collections import defaultdict
 from difflib import SequenceMatcher
 from enum import Enum
 from typing import List, Type
 
+import orjson
+
 from src.categorize.config import categorization_config
 from src.categorize.models import (
     Claim, EntityMention, EntityType, SentimentLevel, TopicCategory,
-    CategorizationOutput, CategorizationOutputLLM, CategorizationResult, CategorizeContext, CategorizeStageMetadata, TopicSummary,
+    CategorizationOutput, CategorizationOutputLLM, CategorizationResult, CategorizeContext, CategorizeStageMetadata,
 )
 from src.categorize.prompts import SYSTEM_PROMPT, USER_PROMPT
 from src.shared.llm import create_client, extract_usage
@@ -47,7 +48,7 @@ class Categorizer:
         if not cat_input.passages:
             raise ValueError("No passages found in categorization input")
 
-        passages_json = json.dumps(self._group_passages(cat_input.passages), indent=2)
+        passages_json = orjson.dumps(self._group_passages(cat_input.passages), option=orjson.OPT_INDENT_2).decode()
         matched = "\n".join(f"  {name}" for name in cat_input.matched_speakers)
 
         system = SYSTEM_PROMPT.format(
@@ -1,5 +1,6 @@
 """Data models for categorization domain."""
 
+from collections import Counter
 from enum import Enum
 from typing import Dict, List
 
@@ -147,9 +148,9 @@ class TopicSummary(BaseModel):
 
 
 def _validate_unique_entities(entities: list) -> list:
-    names = [e.entity_name.lower() for e in entities]
-    if len(names) != len(set(names)):
-        duplicates = {n for n in names if names.count(n) > 1}
+    counts = Counter(e.entity_name.lower() for e in entities)
+    if len(counts) != len(entities):
+        duplicates = {n for n, c in counts.items() if c > 1}
         raise ValueError(f"Duplicate entity names: {duplicates}")
     return entities
 
@@ -4,11 +4,19 @@ Categorization pipeline component for DiscourseKG platform.
 Simple categorization function that will be called by an orchestrator.
 """
 
+from functools import lru_cache
+
 from src.categorize.categorizer import Categorizer
 from src.categorize.models import CategorizeContext
 from src.shared.pipeline_definitions import StageResult
 
 
+@lru_cache(maxsize=1)
+def _get_categorizer() -> Categorizer:
+    """Shared Categorizer so the LLM client and its connection pool are reused across items."""
+    return Categorizer()
+
+
 def categorize_content(processing_context: CategorizeContext) -> StageResult:
     """Categorize content data."""
-    return Categorizer().categorize_content(processing_context)
+    return _get_categorizer().categorize_content(processing_context)
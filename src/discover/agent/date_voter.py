@@ -6,7 +6,7 @@ from typing import Dict, List, Tuple
 
 import pandas as pd
 
-from src.discover.agent.models import Article, DateCandidate, DateSource, DateVoteResult
+from src.discover.agent.models import Article, DateCandidate, DateVoteResult
 
 
 class DateVoter:
@@ -47,11 +47,11 @@ class DateVoter:
         date_scores: Dict[str, Tuple[int, str]] = {}
         for date_str, group in date_groups.items():
             # Sum base weights + consensus bonus (number_of_sources - 1)
-            base_score = sum(DateSource.weight_for(c.source.value) for c in group)
+            base_score = sum(c.source.weight for c in group)
             total_score = base_score + len(group) - 1
             
             # Find highest-weighted source for this date (for date_source return value)
-            highest_source = max(group, key=lambda c: DateSource.weight_for(c.source.value))
+            highest_source = max(group, key=lambda c: c.source.weight)
             
             date_scores[date_str] = (total_score, highest_source.source)
         
@@ -66,3 +66,9 @@ class DateVoter:
             date_score=winner_score,
             date_source=winner_source
         )
+
+    @staticmethod
+    def vote_batch(candidate_lists: List[List[DateCandidate]]) -> List[DateVoteResult]:
+        """Vote on every article of a page in one call; results are parallel to candidate_lists."""
+        vote = DateVoter.vote
+        return [vote(candidates) for candidates in candidate_lists]
@@ -1,19 +1,25 @@
 """Autonomous discovery agent with navigation loop."""
 
 import asyncio
+import re
 import sys
-from datetime import date, datetime, timedelta
-from typing import List, Optional, Set
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from typing import AsyncIterator, List, Optional, Sequence, Union
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig
 
 from src.discover.agent.adblock_engine import setup_blocking
-from src.discover.agent.models import ActionType, Article, NavigationAction, PageExtraction
-from src.discover.agent.stop_condition_checker import StopConditionChecker
+from src.discover.agent.models import ActionType, Article, NavigationAction
+from src.discover.agent.stop_condition_checker import ActionKey, StopConditionChecker
 from src.discover.agent.page_discoverer import PageDiscoverer
 from src.discover.agent.discovery_logger import DiscoveryLogger
 from src.discover.agent.date_voter import DateVoter
 from src.discover.config import DiscoveryConfig, discovery_config
+from src.shared.pipeline_state import get_state_manager
+from src.utils.date_utils import parse_iso_date
 
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
@@ -21,137 +27,218 @@ if sys.platform == 'win32':
 
 
 
-async def _block_popups(page, context, **kwargs):
-    """Close new tabs, strip target="_blank", and block ads via EasyList."""
-    context.on("page", lambda p: asyncio.create_task(p.close()))
+# Click selectors emitted by the LLM for pagination links: a[href='...']
+_HREF_SELECTOR_RE = re.compile(r"a\[href='([^']*)'\]")
+
+# Per-context setup task (init script + adblock route); the hook fires once per page/session, and
+# later pages await the same task so none navigates before the context is fully prepared
+_context_setup: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+async def _prepare_context(context) -> None:
+    """Install the target="_blank" stripping init script and the EasyList route on a browser context."""
     await context.add_init_script(
         "document.addEventListener('DOMContentLoaded',()=>"
         "document.querySelectorAll('a[target=\"_blank\"]').forEach(a=>a.removeAttribute('target')),"
         "{once:true});"
     )
     await setup_blocking(context)
+
+
+async def _block_popups(page, context, **kwargs):
+    """Close popups, strip target="_blank", and block ads via EasyList."""
+    # Page-scoped so concurrent sessions opening their own tabs in the shared context are left alone
+    page.on("popup", lambda p: asyncio.create_task(p.close()))
+    setup = _context_setup.get(context)
+    if setup is None:
+        setup = _context_setup[context] = asyncio.ensure_future(_prepare_context(context))
+    try:
+        await setup
+    except Exception:
+        # Let the next page retry instead of re-raising a stale failure forever
+        if _context_setup.get(context) is setup:
+            del _context_setup[context]
+        raise
     return page
 
 
+@asynccontextmanager
+async def open_crawler(config: DiscoveryConfig = discovery_config) -> AsyncIterator[AsyncWebCrawler]:
+    """Start a browser with popup/ad blocking hooks; share it across agent runs to avoid relaunching."""
+    extra_args = [
+        "--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage",
+        "--disable-extensions", "--disable-background-networking",
+    ]
+    if not config.LOAD_IMAGES:
+        extra_args.append("--blink-settings=imagesEnabled=false")
+    browser_config = BrowserConfig(headless=config.HEADLESS, extra_args=extra_args)
+    async with AsyncWebCrawler(config=browser_config) as crawler:
+        crawler.crawler_strategy.set_hook("on_page_context_created", _block_popups)
+        yield crawler
+
+
 class DiscoveryAgent:
     """Autonomous agent that navigates pages to collect articles within a date range."""
 
+    __slots__ = (
+        "config", "logger", "seen_urls", "visited_actions", "stop_checker",
+        "collected", "all_articles", "duplicates_skipped", "session_id",
+    )
+
     def __init__(self, config: DiscoveryConfig = discovery_config, logger: Optional[DiscoveryLogger] = None) -> None:
         self.config = config
-        self.logger = logger or DiscoveryLogger()
+        self.logger = logger or DiscoveryLogger(enabled=config.VERBOSE)
         self.seen_urls: set[str] = set()
-        self.visited_actions: set[str] = set()
+        self.visited_actions: set[ActionKey] = set()
         self.stop_checker = StopConditionChecker(self.seen_urls, self.visited_actions)
         self.collected: List[Article] = []
         self.all_articles: List[Article] = []
         self.duplicates_skipped: int = 0
-
-    async def run(self, url: str, start_date: str, end_date: str, existing_urls: Optional[Set[str]] = None) -> tuple[List[Article], List[Article]]:
-        """Main discovery loop: observe -> filter -> navigate -> repeat."""
-        existing_urls = existing_urls or set()
-        start_dt = self._parse_date(start_date)
-        end_dt = self._parse_date(end_date)
+        self.session_id = f"{PageDiscoverer.SESSION_ID}_{uuid.uuid4().hex[:8]}"
+
+    @classmethod
+    async def run_many(cls, urls: Sequence[str], start_date: str, end_date: str,
+                       config: DiscoveryConfig = discovery_config) -> List[Union[tuple[List[Article], List[Article]], BaseException]]:
+        """Run one agent per URL concurrently on a single shared browser.
+
+        At most MAX_CONCURRENT_SEARCHES agents run at once. Results are in input order: (collected, all_articles)
+        per URL, or the exception that URL raised so one failing site does not cancel the others.
+        """
+        semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_SEARCHES)
+
+        async def run_one(crawler: AsyncWebCrawler, url: str) -> tuple[List[Article], List[Article]]:
+            async with semaphore:
+                # Label each agent's console output with its search URL; panels from concurrent agents interleave
+                logger = DiscoveryLogger(enabled=config.VERBOSE, label=url)
+                return await cls(config=config, logger=logger).run(url, start_date, end_date, crawler=crawler)
+
+        async with open_crawler(config) as crawler:
+            return await asyncio.gather(*(run_one(crawler, url) for url in urls), return_exceptions=True)
+
+    async def run(self, url: str, start_date: str, end_date: str,
+                  crawler: Optional[AsyncWebCrawler] = None) -> tuple[List[Article], List[Article]]:
+        """Main discovery loop: observe -> filter -> navigate -> repeat.
+
+        Pass an already-started crawler (see open_crawler) to reuse its browser; otherwise one is launched for this run.
+        """
+        if crawler is not None:
+            try:
+                return await self._run(crawler, url, start_date, end_date)
+            finally:
+                # Close this run's tab so the next run on the shared browser starts fresh
+                await crawler.crawler_strategy.kill_session(self.session_id)
+        async with open_crawler(self.config) as crawler:
+            return await self._run(crawler, url, start_date, end_date)
+
+    async def _run(self, crawler: AsyncWebCrawler, url: str, start_date: str,
+                   end_date: str) -> tuple[List[Article], List[Article]]:
+        start_dt = parse_iso_date(start_date)
+        end_dt = parse_iso_date(end_date)
         stop_dt = start_dt - timedelta(days=1)
         
-        browser_config = BrowserConfig(
-            headless=self.config.HEADLESS,
-            extra_args=["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"]
-        )
-        
         pages_processed = 0
         current_url = url
         next_action: NavigationAction = NavigationAction(type=ActionType.SCROLL)
         consecutive_zero = 0
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            crawler.crawler_strategy.set_hook("on_page_context_created", _block_popups)
-            page_discoverer = PageDiscoverer(crawler, self.config)
-
-            for page_num in range(self.config.MAX_PAGES):
-                if stop := self.stop_checker.check_action_visited(current_url, next_action):
+        page_discoverer = PageDiscoverer(crawler, self.config, session_id=self.session_id)
+
+        for page_num in range(self.config.MAX_PAGES):
+            if stop := self.stop_checker.check_action_visited(current_url, next_action):
+                self._stop(stop, pages_processed, start_dt, end_dt)
+                break
+
+            reuse = page_num > 0
+            self.logger.page_start(current_url, page_num, next_action)
+
+            extraction, llm_info = await page_discoverer.observe(
+                current_url, next_action, reuse_session=reuse
+            )
+
+            if next_action.type == ActionType.CLICK:
+                self.stop_checker.mark_action_visited(current_url, next_action)
+            pages_processed += 1
+            batch_articles, dropped = DateVoter.inlier_articles(extraction.articles)
+            self.all_articles.extend(batch_articles)
+            
+            # Filter, collect new URLs and find the oldest reliable date in one pass (updates seen_urls)
+            valid, has_new_urls, oldest_reliable = self._process_batch(batch_articles, start_dt, end_dt)
+            self.collected.extend(valid)
+            
+            # Display-only hint, skipped when output is off; the IN query runs off the event loop so
+            # concurrent agents sharing the browser are not stalled on SQLite
+            already_saved = (
+                len(await asyncio.to_thread(get_state_manager().get_existing_source_urls, [a.url for a in valid]))
+                if self.logger.enabled and valid else 0
+            )
+            self.logger.extraction_result(batch_articles, valid, extraction.next_action, start_dt, end_dt, batch_num=page_num + 1, already_saved=already_saved, extraction_issues=extraction.extraction_issues, dropped=dropped, llm_info=llm_info)
+            next_action = extraction.next_action
+            
+            # Check stop conditions AFTER processing current batch
+            if stop := self.stop_checker.check_batch(batch_articles, oldest_reliable, stop_dt, has_new_urls):
+                self._stop(stop, pages_processed, start_dt, end_dt)
+                break
+            if has_new_urls:
+                consecutive_zero = 0
+            else:
+                consecutive_zero += 1
+                if stop := self.stop_checker.check_exhausted(consecutive_zero):
                     self._stop(stop, pages_processed, start_dt, end_dt)
                     break
 
-                reuse = page_num > 0
-                self.logger.page_start(current_url, page_num, next_action)
-
-                extraction, llm_info = await page_discoverer.observe(
-                    current_url, next_action, reuse_session=reuse
-                )
-
-                if next_action.type == ActionType.CLICK:
-                    self.stop_checker.mark_action_visited(current_url, next_action)
-                pages_processed += 1
-                batch_articles, dropped = DateVoter.inlier_articles(extraction.articles)
-                self.all_articles.extend(batch_articles)
-                
-                # Snapshot new URLs BEFORE _filter_articles mutates seen_urls
-                new_batch_urls = {a.url for a in batch_articles} - self.seen_urls
-                
-                # Filter and collect valid articles (updates seen_urls)
-                valid = self._filter_articles(batch_articles, start_dt, end_dt)
-                self.collected.extend(valid)
-                
-                already_saved = sum(1 for a in valid if a.url in existing_urls)
-                self.logger.extraction_result(batch_articles, valid, extraction.next_action, start_dt, end_dt, batch_num=page_num + 1, already_saved=already_saved, extraction_issues=extraction.extraction_issues, dropped=dropped, llm_info=llm_info)
-                next_action = extraction.next_action
-                
-                # Check stop conditions AFTER processing current batch
-                if stop := self.stop_checker.check_batch(batch_articles, stop_dt, new_batch_urls):
+            if next_action.type == ActionType.CLICK:
+                href = self._href_from_selector(next_action.value)
+                if href:
+                    current_url = href
+                    consecutive_zero = 0
+                elif stop := self.stop_checker.check_href_failed(href, next_action):
                     self._stop(stop, pages_processed, start_dt, end_dt)
                     break
-                if new_batch_urls:
-                    consecutive_zero = 0
-                else:
-                    consecutive_zero += 1
-                    if stop := self.stop_checker.check_exhausted(consecutive_zero):
-                        self._stop(stop, pages_processed, start_dt, end_dt)
-                        break
-
-                if next_action.type == ActionType.CLICK:
-                    href = self._href_from_selector(next_action.value)
-                    if href:
-                        current_url = href
-                        consecutive_zero = 0
-                    elif stop := self.stop_checker.check_href_failed(href, next_action):
-                        self._stop(stop, pages_processed, start_dt, end_dt)
-                        break
-            else:
-                self._stop(StopConditionChecker.reason_max_pages(), pages_processed, start_dt, end_dt)
-        
+        else:
+            self._stop(StopConditionChecker.reason_max_pages(), pages_processed, start_dt, end_dt)
+
         return self.collected, self.all_articles
     
-    def _parse_date(self, date_str: str) -> date:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
-
     def _stop(self, reason: str, pages_processed: int, start_dt: date, end_dt: date) -> None:
         self.logger.stopping(reason)
 
     def _href_from_selector(self, selector: str) -> Optional[str]:
-        if not selector.startswith("a[href='") or "']" not in selector:
-            return None
-        try:
-            return selector.split("href='")[1].split("']")[0]
-        except IndexError:
-            return None
-
-    def _filter_articles(self, articles: List[Article], start_dt: date, end_dt: date) -> List[Article]:
-        """Filter articles by date range and deduplicate."""
-        valid = []
+        match = _HREF_SELECTOR_RE.match(selector)
+        return match.group(1) if match else None
+
+    def _process_batch(self, articles: List[Article], start_dt: date, end_dt: date) -> tuple[List[Article], bool, Optional[date]]:
+        """Single pass over a batch: filter by date range and dedupe, flag unseen URLs, track oldest reliable date.
+
+        Returns (valid articles, whether any URL was unseen before this batch, oldest reliably-dated publication date).
+        """
+        valid: List[Article] = []
+        valid_append = valid.append
+        has_new_urls = False
+        oldest_reliable: Optional[date] = None
+        threshold = DateVoter.THRESHOLD
+        seen = self.seen_urls
+        parse = parse_iso_date
+        duplicates = 0
         for article in articles:
-            if article.url in self.seen_urls:
-                self.duplicates_skipped += 1
-                continue
-            if article.date_score is None or article.date_score < DateVoter.THRESHOLD:
-                continue
-            if not article.publication_date:
-                continue
-            try:
-                article_date = self._parse_date(article.publication_date)
-            except ValueError:
+            url = article.url
+            pub_date = article.publication_date
+            score = article.date_score
+            article_date = None
+            if score is not None and score >= threshold and pub_date:
+                try:
+                    article_date = parse(pub_date)
+                except ValueError:
+                    pass
+                else:
+                    if oldest_reliable is None or article_date < oldest_reliable:
+                        oldest_reliable = article_date
+            if url in seen:
+                duplicates += 1
                 continue
-            if not (start_dt <= article_date <= end_dt):
+            has_new_urls = True
+            if article_date is None or not (start_dt <= article_date <= end_dt):
                 continue
-            valid.append(article)
-            self.seen_urls.add(article.url)
-        return valid
+            valid_append(article)
+            seen.add(url)
+        self.duplicates_skipped += duplicates
+        return valid, has_new_urls, oldest_reliable
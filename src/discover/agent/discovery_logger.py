@@ -1,34 +1,49 @@
 """Compact rich console logging for discovery agent visibility."""
 
-from datetime import date, datetime
-from typing import Dict, List, Optional, Union
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from src.discover.agent.models import Article, NavigationAction
-from src.shared.pipeline_state import PipelineStateManager
+from src.utils.date_utils import parse_iso_date
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-def get_existing_source_urls() -> set[str]:
-    """Return set of source URLs already in pipeline."""
-    states = PipelineStateManager().get_all_states()
-    return {s.source_url for s in states if s.source_url}
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Create the rich Console on first use so rich is only imported when output is enabled."""
+    from rich.console import Console
+    return Console()
 
 
 class DiscoveryLogger:
     """Lightweight logger for discovery agent thinking visibility."""
 
+    __slots__ = ("enabled", "label")
+
+    def __init__(self, enabled: bool = True, label: Optional[str] = None) -> None:
+        self.enabled = enabled
+        # Search URL shown in panel titles so output from concurrently running agents can be told apart
+        self.label = label
+
+    def _title(self, title: Optional[str] = None) -> Optional[str]:
+        if not self.label:
+            return title
+        label = self.label[:60]
+        return f"{title} | {label}" if title else label
+
     def page_start(self, url: str, page_num: int, action: NavigationAction) -> None:
         """Log page processing start."""
+        if not self.enabled:
+            return
+        from rich.panel import Panel
+
         action_str = self._format_action(action)
-        console.print(Panel(
+        _console().print(Panel(
             f"[bold]Step {page_num + 1}[/bold] | {url[:80]}...\n[cyan]{action_str}[/cyan]",
-            border_style="blue"
+            title=self._title(), title_align="left", border_style="blue"
         ))
     
     def extraction_result(self, articles: List[Article], valid: List[Article],
@@ -38,38 +53,37 @@ class DiscoveryLogger:
                           dropped: Optional[List[Article]] = None,
                           llm_info: Optional[Dict[str, Union[int, float]]] = None) -> None:
         """Log extraction results with article summary."""
-        page_date_range = self._get_date_range(articles)
-
-        summary = Text()
-        summary.append(f"Discovered Range ", style="white")
-        if page_date_range:
-            summary.append(f"[{page_date_range['min']} - {page_date_range['max']}]: ", style="white")
-        else:
-            summary.append(": ", style="white")
-        summary.append(f"{len(articles)}", style="white")
-        summary.append(" articles", style="white")
+        if not self.enabled:
+            return
 
-        summary.append(f"\nTarget Range [{start_dt} - {end_dt}]: ", style="white")
-        summary.append(f"{len(valid)}", style="green bold")
-        summary.append(" articles", style="white")
+        page_date_range = self._get_date_range(articles)
+        range_str = f"[{page_date_range['min']} - {page_date_range['max']}]: " if page_date_range else ": "
+
+        parts: List[Tuple[str, str]] = [
+            (f"Discovered Range {range_str}{len(articles)} articles", "white"),
+            (f"\nTarget Range [{start_dt} - {end_dt}]: ", "white"),
+            (f"{len(valid)}", "green bold"),
+            (" articles", "white"),
+        ]
         if already_saved:
-            summary.append(f" ({already_saved} already saved)", style="dim")
-
+            parts.append((f" ({already_saved} already saved)", "dim"))
         if dropped:
-            summary.append(f"\nDropped ", style="yellow")
-            summary.append(f"{len(dropped)}", style="yellow bold")
-            summary.append(" date outlier(s)", style="yellow")
-
-        summary.append(f"\nNext: ", style="white")
-        summary.append(self._format_action(next_action), style="cyan")
-
+            parts.append((f"\nDropped {len(dropped)} date outlier(s)", "yellow"))
+        parts.append(("\nNext: ", "white"))
+        parts.append((self._format_action(next_action), "cyan"))
         if extraction_issues:
-            summary.append(f"\nIssues: {', '.join(extraction_issues)}", style="red")
-
+            parts.append((f"\nIssues: {', '.join(extraction_issues)}", "red"))
         if llm_info:
-            summary.append(f"\nLLM: {llm_info['input_tokens']:,} in + {llm_info['output_tokens']:,} out = {llm_info['total_tokens']:,} tokens | time: {llm_info['llm_time']:.2f}s", style="dim")
+            parts.append((f"\nLLM: {llm_info['input_tokens']:,} in + {llm_info['output_tokens']:,} out = {llm_info['total_tokens']:,} tokens | time: {llm_info['llm_time']:.2f}s", "dim"))
 
-        console.print(Panel(summary, title=f"Results Batch-{batch_num}", title_align="left", border_style="white"))
+        # Same rendering as every other method; rich drops colour and styling itself when output is not a TTY
+        console = _console()
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+
+        summary = Text.assemble(*parts)
+        console.print(Panel(summary, title=self._title(f"Results Batch-{batch_num}"), title_align="left", border_style="white"))
 
         if dropped:
             drop_table = Table(show_header=True, header_style="bold yellow", border_style="yellow")
@@ -103,35 +117,16 @@ class DiscoveryLogger:
     
     def stopping(self, reason: str) -> None:
         """Log stop condition."""
+        if not self.enabled:
+            return
+        from rich.panel import Panel
+        from rich.text import Text
+
         summary = Text()
         summary.append("Stopping: ", style="red bold")
         summary.append(reason, style="white")
-        console.print(Panel(summary, border_style="red"))
+        _console().print(Panel(summary, title=self._title(), title_align="left", border_style="red"))
     
-    def complete(self, valid_articles: List[Article], all_articles: List[Article], pages: int,
-                  start_dt: date, end_dt: date, duplicates_skipped: int = 0) -> None:
-        """Log final summary (per-URL agent run)."""
-        all_date_range = self._get_date_range(all_articles)
-        summary = Text()
-        summary.append("Complete", style="green bold")
-
-        if all_date_range:
-            summary.append(f"\nDiscovered Range [{all_date_range['min']} - {all_date_range['max']}]: ", style="white")
-            summary.append(f"{all_date_range['count']}", style="white")
-            summary.append(" articles", style="white")
-        else:
-            summary.append("\nDiscovered Range: ", style="white")
-            summary.append("0", style="white")
-            summary.append(" articles", style="white")
-
-        summary.append(f"\nTarget Range [{start_dt} - {end_dt}]: ", style="white")
-        summary.append(f"{len(valid_articles)}", style="green bold")
-        summary.append(" new articles", style="white")
-        if duplicates_skipped:
-            summary.append(f" ({duplicates_skipped} duplicates skipped)", style="dim")
-        
-        console.print(Panel(summary, border_style="green"))
-
     def aggregate_complete(
         self,
         discovered: List,
@@ -145,6 +140,11 @@ class DiscoveryLogger:
         date_range_max: Optional[str] = None,
     ) -> None:
         """Log final discovery summary (aggregate across URLs)."""
+        if not self.enabled:
+            return
+        from rich.panel import Panel
+        from rich.text import Text
+
         dates = [date_range_min, date_range_max] if date_range_min and date_range_max else []
         summary = Text()
         summary.append("Complete", style="green bold")
@@ -162,23 +162,31 @@ class DiscoveryLogger:
         if duplicates_skipped:
             summary.append(f", {duplicates_skipped} already saved", style="dim")
         summary.append(f" ({processing_time}s)", style="dim")
-        console.print(Panel(summary, border_style="green"))
+        _console().print(Panel(summary, border_style="green"))
     
     def _get_date_range(self, articles: List[Article]) -> Optional[Dict[str, Union[str, int]]]:
-        """Get min-max date range from articles with valid dates."""
-        dates = []
+        """Get min-max date range from articles with valid dates (single pass)."""
+        lo = hi = None
+        count = 0
         for article in articles:
-            if article.publication_date:
-                try:
-                    dates.append(datetime.strptime(article.publication_date, "%Y-%m-%d").date())
-                except ValueError:
-                    continue
-        if not dates:
+            pub_date = article.publication_date
+            if not pub_date:
+                continue
+            try:
+                d = parse_iso_date(pub_date)
+            except ValueError:
+                continue
+            count += 1
+            if lo is None or d < lo:
+                lo = d
+            if hi is None or d > hi:
+                hi = d
+        if not count:
             return None
         return {
-            "min": min(dates).isoformat(),
-            "max": max(dates).isoformat(),
-            "count": len(dates)
+            "min": lo.isoformat(),
+            "max": hi.isoformat(),
+            "count": count
         }
     
     def _format_action(self, action: NavigationAction) -> str:
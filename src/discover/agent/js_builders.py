@@ -1,9 +1,16 @@
 """JS code builders for crawl4ai page actions."""
 
-import json
+import math
+
+import orjson
 
 SCROLL_WAIT_MS = 1000
 SCROLL_POLL_MS = 150
+# Polls needed to cover SCROLL_WAIT_MS, folded into the JS as a literal
+SCROLL_POLL_COUNT = math.ceil(SCROLL_WAIT_MS / SCROLL_POLL_MS)
+
+# Placeholder in the click template, replaced with the JSON-encoded selector
+_SELECTOR_PLACEHOLDER = "__SELECTOR__"
 
 
 def _jump_wait_js() -> str:
@@ -23,35 +30,28 @@ def _jump_wait_js() -> str:
         }}
         
         const prevHeight = document.body.scrollHeight;
-        let elapsed = 0;
-        while (elapsed < {SCROLL_WAIT_MS}) {{
+        for (let i = 0; i < {SCROLL_POLL_COUNT}; i++) {{
             await delay({SCROLL_POLL_MS});
-            elapsed += {SCROLL_POLL_MS};
             if (document.body.scrollHeight > prevHeight) break;
         }}
     """
 
 
-def build_scroll_js() -> str:
-    """Build JS for scroll action."""
-    return f"""
+# Built once at import: only the click selector varies between actions
+_SCROLL_JS = f"""
         (async () => {{
             {_jump_wait_js()}
         }})();
         """
 
-
-def build_click_js(selector: str) -> str:
-    """Build JS for click action. Selector must be JSON-encoded."""
-    selector_js = json.dumps(selector)
-    return f"""
+_CLICK_JS_TEMPLATE = f"""
         (async () => {{
             const delay = ms => new Promise(r => setTimeout(r, ms));
             await delay(100);
             
-            let el = document.querySelector({selector_js});
-            if (!el && {selector_js}.includes(':contains("')) {{
-                const text = {selector_js}.split(':contains("')[1].split('")')[0];
+            let el = document.querySelector({_SELECTOR_PLACEHOLDER});
+            if (!el && {_SELECTOR_PLACEHOLDER}.includes(':contains("')) {{
+                const text = {_SELECTOR_PLACEHOLDER}.split(':contains("')[1].split('")')[0];
                 el = Array.from(document.querySelectorAll('a, button, span, div'))
                     .find(e => e.textContent.trim() === text);
             }}
@@ -65,3 +65,13 @@ def build_click_js(selector: str) -> str:
             {_jump_wait_js()}
         }})();
         """
+
+
+def build_scroll_js() -> str:
+    """Build JS for scroll action."""
+    return _SCROLL_JS
+
+
+def build_click_js(selector: str) -> str:
+    """Build JS for click action. Selector must be JSON-encoded."""
+    return _CLICK_JS_TEMPLATE.replace(_SELECTOR_PLACEHOLDER, orjson.dumps(selector).decode())
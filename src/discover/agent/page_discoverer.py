@@ -1,13 +1,13 @@
 """Crawl4ai wrapper for page observation and article discovery."""
 
 import time
-from difflib import Differ
-from typing import List, Optional, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, LLMExtractionStrategy, LLMConfig
 
 from src.discover.agent.js_builders import build_click_js, build_scroll_js
-from src.discover.agent.models import ActionType, PageExtraction, NavigationAction, Article, ArticleExtraction
+from src.discover.agent.models import ActionType, PageExtraction, NavigationAction
 from src.discover.agent.prompts import build_extraction_prompt
 from src.discover.agent.adblock_engine import EXCLUDED_SELECTOR
 from src.discover.agent.date_voter import DateVoter
@@ -22,16 +22,26 @@ class PageDiscoverer:
 
     SESSION_ID = "discovery_session"
 
-    def __init__(self, crawler: AsyncWebCrawler, config: DiscoveryConfig = discovery_config) -> None:
+    def __init__(self, crawler: AsyncWebCrawler, config: DiscoveryConfig = discovery_config,
+                 session_id: str = SESSION_ID) -> None:
         self.crawler = crawler
         self.config = config
-        self._last_markdown: Optional[str] = None
-
-    def _diff_added_only(self, old: str, new: str) -> str:
-        """Return only lines added in new relative to old (Differ, line-based)."""
-        differ = Differ()
-        result = differ.compare(old.splitlines(keepends=True), new.splitlines(keepends=True))
-        return "".join(line[2:] for line in result if line.startswith("+ "))
+        self.session_id = session_id
+        # Previous page markdown, kept pre-split so each page is split into lines only once
+        self._last_markdown_lines: Optional[List[str]] = None
+        # Full and delta strategies, built on first use and reused for every page (keyed by delta_mode)
+        self._strategies: Dict[bool, LLMExtractionStrategy] = {}
+
+    def _diff_added_only(self, old_lines: List[str], new_lines: List[str]) -> str:
+        """Return only lines added in new relative to old (multiset line diff, order preserved)."""
+        old_counts = Counter(old_lines)
+        added = []
+        for line in new_lines:
+            if old_counts[line] > 0:
+                old_counts[line] -= 1
+            else:
+                added.append(line)
+        return "".join(added)
 
     def _build_js_code(self, action: Optional[NavigationAction]) -> List[str]:
         """Generate JS code for the given action."""
@@ -58,7 +68,7 @@ class PageDiscoverer:
             'word_count_threshold': 50,
             'js_code': self._build_js_code(action),
             'js_only': reuse_session,
-            'session_id': self.SESSION_ID,
+            'session_id': self.session_id,
             'delay_before_return_html': 5.0,
             'excluded_tags': ['script', 'style'],
             'excluded_selector': EXCLUDED_SELECTOR,
@@ -85,6 +95,21 @@ class PageDiscoverer:
             apply_chunking=False,
         )
 
+    def _extraction_strategy(self, delta_mode: bool) -> LLMExtractionStrategy:
+        """Return the cached strategy for this mode, creating it on first use."""
+        strategy = self._strategies.get(delta_mode)
+        if strategy is None:
+            strategy = self._strategies[delta_mode] = self._create_extraction_strategy(delta_mode=delta_mode)
+        return strategy
+
+    @staticmethod
+    def _usage_totals(strategy: LLMExtractionStrategy) -> Optional[Tuple[int, int, int]]:
+        """Cumulative (prompt, completion, total) tokens; strategies are reused so callers take deltas."""
+        usage = getattr(strategy, "total_usage", None)
+        if not usage:
+            return None
+        return usage.prompt_tokens, usage.completion_tokens, usage.total_tokens
+
     async def observe(
         self,
         url: str,
@@ -93,32 +118,40 @@ class PageDiscoverer:
     ) -> Tuple[PageExtraction, Optional[dict]]:
         """Execute action and extract articles + next navigation. Returns (extraction, llm_info)."""
         result = await self.crawler.arun(
-            url, config=self._crawler_config(action, reuse_session), session_id=self.SESSION_ID
+            url, config=self._crawler_config(action, reuse_session), session_id=self.session_id
         )
         if not result.success:
             return PageExtraction(), None
 
         markdown = result.markdown.raw_markdown
-        use_delta = reuse_session and self._last_markdown is not None and action and action.type == ActionType.SCROLL
+        # CrawlResult also holds raw/cleaned HTML, links and media; release it before the long LLM await
+        del result
+        markdown_lines = markdown.splitlines(keepends=True)
+        use_delta = reuse_session and self._last_markdown_lines is not None and action and action.type == ActionType.SCROLL
         if use_delta:
-            extraction_content = self._diff_added_only(self._last_markdown, markdown)
+            extraction_content = self._diff_added_only(self._last_markdown_lines, markdown_lines)
         else:
             extraction_content = markdown
-        self._last_markdown = markdown
+        self._last_markdown_lines = markdown_lines
 
-        strategy = self._create_extraction_strategy(delta_mode=use_delta)
+        # Scroll revealed nothing new: the LLM would only re-see content already extracted
+        if use_delta and not extraction_content.strip():
+            return PageExtraction(extraction_issues=["no new content after scroll"]), None
 
-        llm_start = time.time()
+        strategy = self._extraction_strategy(use_delta)
+        usage_before = self._usage_totals(strategy) or (0, 0, 0)
+
+        llm_start = time.perf_counter()
         raw = await strategy.arun(url, [extraction_content])
-        llm_time = time.time() - llm_start
+        llm_time = time.perf_counter() - llm_start
 
         llm_info = {"markdown_len": len(markdown), "llm_time": llm_time}
-        total_usage = getattr(strategy, "total_usage", None)
-        if total_usage:
+        usage_after = self._usage_totals(strategy)
+        if usage_after:
             llm_info.update({
-                "input_tokens": total_usage.prompt_tokens,
-                "output_tokens": total_usage.completion_tokens,
-                "total_tokens": total_usage.total_tokens,
+                "input_tokens": usage_after[0] - usage_before[0],
+                "output_tokens": usage_after[1] - usage_before[1],
+                "total_tokens": usage_after[2] - usage_before[2],
             })
 
         parsed = raw[0] if raw else {}
@@ -129,20 +162,11 @@ class PageDiscoverer:
             logger.error(f"{mode.capitalize()} extraction parse failed: {e}")
             ext = PageExtraction()
         
-        # Convert ArticleExtraction to Article after voting
-        final_articles = []
-        for article_extraction in ext.articles:
-            vote_result = DateVoter.vote(article_extraction.date_candidates)
-            final_article = Article(
-                title=article_extraction.title,
-                url=article_extraction.url,
-                date_candidates=article_extraction.date_candidates,
-                publication_date=vote_result.publication_date,
-                date_score=vote_result.date_score,
-                date_source=vote_result.date_source
-            )
-            final_articles.append(final_article)
-        
-        ext.articles = final_articles
+        # PageExtraction already validated these as Article; fill in the vote fields in place
+        votes = DateVoter.vote_batch([a.date_candidates for a in ext.articles])
+        for article, vote_result in zip(ext.articles, votes):
+            article.publication_date = vote_result.publication_date
+            article.date_score = vote_result.date_score
+            article.date_source = vote_result.date_source
 
         return ext, llm_info
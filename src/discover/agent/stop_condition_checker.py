@@ -1,10 +1,11 @@
 """Stop condition logic for discovery loop."""
 
-from datetime import date, datetime
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 
 from src.discover.agent.models import ActionType, Article, NavigationAction
-from src.discover.agent.date_voter import DateVoter
+
+ActionKey = Tuple[str, ActionType, Optional[str]]
 
 
 class StopConditionChecker:
@@ -12,12 +13,12 @@ class StopConditionChecker:
 
     ZERO_BATCH_THRESHOLD = 2
 
-    def __init__(self, seen_urls: set[str], visited_actions: set[str]) -> None:
+    def __init__(self, seen_urls: set[str], visited_actions: set[ActionKey]) -> None:
         self.seen_urls = seen_urls
         self.visited_actions = visited_actions
 
-    def _action_key(self, url: str, action: NavigationAction) -> str:
-        return f"{url}:{action.type}:{action.value}"
+    def _action_key(self, url: str, action: NavigationAction) -> ActionKey:
+        return (url, action.type, action.value)
 
     def mark_action_visited(self, url: str, action: NavigationAction) -> None:
         """Mark a click action as visited."""
@@ -32,22 +33,15 @@ class StopConditionChecker:
             return "action_already_visited"
         return None
 
-    def check_batch(self, articles: List[Article], stop_dt: date, new_batch_urls: set[str]) -> Optional[str]:
+    def check_batch(self, articles: List[Article], oldest_reliable: Optional[date], stop_dt: date, has_new_urls: bool) -> Optional[str]:
         """Return stop reason if batch triggers date_threshold or duplicate_content, else None.
         
-        new_batch_urls must be computed BEFORE _filter_articles updates seen_urls.
+        oldest_reliable and has_new_urls come from DiscoveryAgent._process_batch, which
+        checks each URL against seen_urls before adding the batch's valid articles to it.
         """
-        reliable_dates = []
-        for a in articles:
-            if a.date_score is None or a.date_score < DateVoter.THRESHOLD or not a.publication_date:
-                continue
-            try:
-                reliable_dates.append(datetime.strptime(a.publication_date, "%Y-%m-%d").date())
-            except ValueError:
-                continue
-        if reliable_dates and min(reliable_dates) < stop_dt:
+        if oldest_reliable is not None and oldest_reliable < stop_dt:
             return "date_threshold"
-        if articles and not new_batch_urls:
+        if articles and not has_new_urls:
             return "duplicate_content"
         return None
 
@@ -11,7 +11,10 @@ load_dotenv()
 class DiscoveryConfig(BaseModel):
     """Configuration for the discovery agent."""
     HEADLESS: bool = Field(default=False, description="Run browser in headless mode")
+    LOAD_IMAGES: bool = Field(default=False, description="Load images in the browser (listing extraction only needs text)")
     MAX_PAGES: int = Field(default=5, description="Maximum pages to process per search URL")
+    MAX_CONCURRENT_SEARCHES: int = Field(default=4, description="Search URLs discovered concurrently on the shared browser")
+    VERBOSE: bool = Field(default=True, description="Print rich per-page progress panels")
     
     OPENAI_API_KEY: Optional[str] = Field(default_factory=lambda: os.getenv('OPENAI_API_KEY'))
     OPENAI_MODEL: str = Field(default="gpt-4o-mini")
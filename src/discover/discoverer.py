@@ -8,20 +8,33 @@ replacing the previous mock discovery implementation.
 import asyncio
 import time
 from datetime import datetime
-from typing import List
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 from src.discover.agent.date_voter import DateVoter
 from src.discover.agent.discovery_agent import DiscoveryAgent
-from src.discover.agent.discovery_logger import DiscoveryLogger, get_existing_source_urls
+from src.discover.agent.discovery_logger import DiscoveryLogger
 from src.discover.agent.models import Article
 from src.discover.config import discovery_config, DiscoveryConfig
-from src.discover.models import DiscoveredArticle, DiscoveryData, DiscoveryResult, DiscoveryRequest
-from src.shared.persistence import save_data
-from src.shared.pipeline_state import PipelineStateManager
+from src.discover.models import DiscoveredArticle, DiscoveryRequest
+from src.shared.persistence import delete_data, save_data
+from src.shared.pipeline_state import get_state_manager
 from src.shared.pipeline_definitions import PipelineStages, StageResult
 from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
+T = TypeVar("T")
+
+_DISCOVER_STAGE = PipelineStages.DISCOVER.value
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on uvloop when it is installed, otherwise on the stdlib loop; no global policy is changed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
 
 
 class Discoverer:
@@ -35,95 +48,131 @@ class Discoverer:
     def __init__(self, config: DiscoveryConfig = discovery_config):
         self.config = config
     
-    async def _run_agent_async(self, search_url: str, start_date: str, end_date: str, existing_urls: set) -> tuple:
-        """Run the discovery agent asynchronously."""
-        agent = DiscoveryAgent(config=self.config)
-        return await agent.run(search_url, start_date, end_date, existing_urls=existing_urls)
-    
     def discover_content(self, discovery_params: DiscoveryRequest) -> StageResult:
         """Discover content sources using the autonomous agent."""
         if not discovery_params.search_urls:
             logger.warning("No search URLs provided")
             return self._create_result(discovery_params, [], 0, 0)
         
-        start_time = time.time()
-        logger.info(f"Starting discovery ({len(discovery_params.search_urls)} search URLs)")
+        start_time = time.perf_counter()
+        logger.info("Starting discovery (%d search URLs)", len(discovery_params.search_urls))
         
-        run_timestamp = datetime.now().strftime("%Y-%m-%d_%H:%M:%S")
-        manager = PipelineStateManager()
+        now = datetime.now()
+        run_timestamp = now.strftime("%Y-%m-%d_%H:%M:%S")
+        manager = get_state_manager()
         all_discovered: List[DiscoveredArticle] = []
+        discovered_payloads: List[Dict[str, Any]] = []
         total_found = 0
         duplicates_skipped = 0
-        all_dates: List[str] = []
+        date_min: Optional[str] = None
+        date_max: Optional[str] = None
         total_all = 0
 
-        end_date = discovery_params.end_date or datetime.now().strftime("%Y-%m-%d")
-        existing_urls = get_existing_source_urls()
-        for search_url in discovery_params.search_urls:
-            logger.info(f"Searching: {search_url}")
+        end_date = discovery_params.end_date or now.strftime("%Y-%m-%d")
+        logger.info("Searching: %s", ", ".join(discovery_params.search_urls))
+        # One shared browser for all search URLs; agents run concurrently up to MAX_CONCURRENT_SEARCHES
+        results = _run_async(DiscoveryAgent.run_many(
+            discovery_params.search_urls, discovery_params.start_date, end_date,
+            config=self.config,
+        ))
+
+        # Score filter computed once per search URL and shared by the bulk lookup and the persist pass
+        threshold = DateVoter.THRESHOLD
+        completed = []
+        for search_url, outcome in zip(discovery_params.search_urls, results):
+            if isinstance(outcome, BaseException):
+                logger.error("Error searching %s: %s", search_url, outcome, exc_info=outcome)
+                continue
+            articles, all_articles = outcome
+            eligible = [a for a in articles if a.date_score is not None and a.date_score >= threshold]
+            completed.append((search_url, articles, all_articles, eligible))
+
+        # Single source of truth for dedupe: one bulk query over this run's candidate URLs, then the
+        # in-run set grows as articles are recorded below so cross-search-URL repeats are skipped too.
+        candidate_urls = {a.url for *_, eligible in completed for a in eligible}
+        existing_urls = manager.get_existing_source_urls(candidate_urls)
 
+        # Persist sequentially so SQLite state and artifact files are written in search-URL order
+        for search_url, articles, all_articles, eligible in completed:
             try:
-                articles, all_articles = asyncio.run(self._run_agent_async(search_url, discovery_params.start_date, end_date, existing_urls))
                 total_found += len(articles)
                 total_all += len(all_articles)
                 for a in all_articles:
-                    if getattr(a, "publication_date", None):
-                        all_dates.append(a.publication_date)
+                    d = getattr(a, "publication_date", None)
+                    if d:
+                        if date_min is None or d < date_min:
+                            date_min = d
+                        if date_max is None or d > date_max:
+                            date_max = d
                 
-                for article in articles:
-                    if article.date_score is None or article.date_score < DateVoter.THRESHOLD:
-                        continue
-                    
-                    if manager.get_state_by_source_url(article.url):
-                        duplicates_skipped += 1
-                        continue
-                    
-                    discovered = DiscoveredArticle.from_article(article, search_url=search_url)
-                    file_path = save_data(discovered, discovered.model_dump(mode='json'), PipelineStages.DISCOVER.value)
-                    manager.record_discover_result(discovered, run_timestamp, file_path)
-                    existing_urls.add(article.url)
-                    all_discovered.append(discovered)
-                    logger.debug(f"Discovered: {discovered.id}")
+                new_articles = [a for a in eligible if a.url not in existing_urls]
+                duplicates_skipped += len(eligible) - len(new_articles)
+                saved: List[Tuple[DiscoveredArticle, str, Dict[str, Any]]] = []
+                try:
+                    for a in new_articles:
+                        saved.append(self._save_article(a, search_url))
+                    manager.record_discover_results(saved, run_timestamp)
+                except Exception:
+                    # The state rows rolled back, so drop this search URL's files too; no orphan artifacts
+                    for _, file_path, _ in saved:
+                        delete_data(file_path)
+                    raise
+                all_discovered.extend(discovered for discovered, _, _ in saved)
+                discovered_payloads.extend(payload for _, _, payload in saved)
+                existing_urls.update(a.url for a in new_articles)
                     
             except Exception as e:
-                logger.error(f"Error searching {search_url}: {e}", exc_info=True)
+                logger.error("Error processing results for %s: %s", search_url, e, exc_info=True)
                 continue
         
-        processing_time = round(time.time() - start_time, 2)
-        date_min = min(all_dates) if all_dates else None
-        date_max = max(all_dates) if all_dates else None
-        DiscoveryLogger().aggregate_complete(
+        if all_discovered:
+            logger.debug("Discovered %d new articles: first=%s last=%s",
+                         len(all_discovered), all_discovered[0].id, all_discovered[-1].id)
+
+        processing_time = round(time.perf_counter() - start_time, 2)
+        DiscoveryLogger(enabled=self.config.VERBOSE).aggregate_complete(
             all_discovered, total_found, total_all, duplicates_skipped, processing_time,
             discovery_params.start_date, end_date, date_min, date_max
         )
-        return self._create_result(discovery_params, all_discovered, total_found, duplicates_skipped)
+        return self._create_result(discovery_params, discovered_payloads, total_found, duplicates_skipped, now=now)
     
+    def _save_article(self, article: Article, search_url: str) -> Tuple[DiscoveredArticle, str, Dict[str, Any]]:
+        """Write a newly discovered article's artifact. Returns (article, file_path, dumped data) for state recording."""
+        discovered = DiscoveredArticle.from_article(article, search_url=search_url)
+        payload = discovered.model_dump(mode='json')
+        file_path = save_data(discovered, payload, _DISCOVER_STAGE)
+        return discovered, file_path, payload
+
     def _create_result(
         self,
         request: DiscoveryRequest,
-        discovered_articles: List[DiscoveredArticle],
+        discovered_payloads: List[Dict[str, Any]],
         total_found: int,
-        duplicates_skipped: int
+        duplicates_skipped: int,
+        now: Optional[datetime] = None
     ) -> StageResult:
-        """Create StageResult with discovery data."""
-        discovery_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        """Create StageResult with discovery data.
+
+        The artifact is built as a plain dict in DiscoveryResult's dumped shape, reusing the per-article
+        payloads already dumped for persistence; readers use DiscoveryResult.model_validate for typed access.
+        """
+        # Reuse the run's clock reading so discovery_id and run_timestamp name the same instant
+        discovery_timestamp = (now or datetime.now()).strftime('%Y%m%d_%H%M%S')
         discovery_id = f"discovery-{discovery_timestamp}"
         
-        discovery_data = DiscoveryData(
-            discovery_id=discovery_id,
-            discovered_articles=discovered_articles,
-            date_range=f"{request.start_date} to {request.end_date or 'present'}",
-            total_found=total_found,
-            new_articles=len(discovered_articles),
-            duplicates_skipped=duplicates_skipped
-        )
-        
         return StageResult(
-            artifact=DiscoveryResult(
-                id=discovery_id,
-                success=True,
-                data=discovery_data,
-                error_message=None
-            ).model_dump(mode='json'),
+            artifact={
+                "id": discovery_id,
+                "success": True,
+                "data": {
+                    "discovery_id": discovery_id,
+                    "discovered_articles": discovered_payloads,
+                    "date_range": f"{request.start_date} to {request.end_date or 'present'}",
+                    "total_found": total_found,
+                    "new_articles": len(discovered_payloads),
+                    "duplicates_skipped": duplicates_skipped,
+                },
+                "error_message": None,
+            },
             metadata={}
         )
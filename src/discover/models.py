@@ -21,11 +21,14 @@ class DiscoveredArticle(BaseModel):
     date_score: int = Field(..., description="Confidence score for the date")
     date_source: str = Field(..., description="Source of the date (datetime_attr, url_path, etc.)")
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
     @classmethod
     def generate_id(cls, article: Article) -> str:
         """Generate unique ID from article: {title_slug}_{url_hash}."""
         title_slug = slugify(article.title, max_length=40)
-        url_hash = hashlib.md5(article.url.encode()).hexdigest()[:6]
+        # Non-cryptographic use; md5 is kept so IDs of already-stored articles stay stable
+        url_hash = hashlib.md5(article.url.encode(), usedforsecurity=False).hexdigest()[:6]
         return f"{title_slug}_{url_hash}"
 
     @classmethod
@@ -48,6 +51,8 @@ class DiscoveryRequest(BaseModel):
     end_date: Optional[str] = Field(None, description="End of discovery date range (YYYY-MM-DD); None = today")
     search_urls: List[str] = Field(default_factory=list, description="URLs to search for content")
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class DiscoveryData(BaseModel):
     """Discovery operation data."""
@@ -58,7 +63,9 @@ class DiscoveryData(BaseModel):
     new_articles: int = Field(0, description="New articles added (after deduplication)")
     duplicates_skipped: int = Field(0, description="Duplicate articles skipped")
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class DiscoveryResult(StageOperationResult[DiscoveryData]):
     """Result of discovery operation."""
-    pass
+    model_config = {"frozen": True, "extra": "forbid"}
@@ -15,6 +15,13 @@ class GraphConfig(BaseModel):
     NEO4J_USER: Optional[str] = Field(default_factory=lambda: os.getenv("NEO4J_USER"))
     NEO4J_PASSWORD: Optional[str] = Field(default_factory=lambda: os.getenv("NEO4J_PASSWORD"))
     NEO4J_DATABASE: Optional[str] = Field(default_factory=lambda: os.getenv("NEO4J_DATABASE"))
+
+    # Stage artifacts are validated when written; re-validate on read only when debugging schema drift
+    STRICT_VALIDATION: bool = Field(default_factory=lambda: os.getenv("GRAPH_STRICT_VALIDATION", "").lower() == "true")
+    # Items loaded concurrently by graph_flow; they share the process-wide driver's connection pool
+    MAX_WORKERS: int = Field(default_factory=lambda: int(os.getenv("GRAPH_MAX_WORKERS", "1")))
+    # Max rows per UNWIND level before a document is loaded as per-chunk transactions instead of one
+    UNWIND_BATCH_SIZE: int = Field(default=1000)
     
     model_config = {"frozen": True}  # Make immutable
 
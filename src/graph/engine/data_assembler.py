@@ -1,17 +1,18 @@
 """Assembles graph data from pipeline stage outputs."""
 
-import json
 from typing import Any, Dict, List
 
-from src.categorize.models import CategorizationOutput, CategorizationResult
+from pydantic import BaseModel
+
+from src.categorize.models import CategorizationResult
 from src.filter.models import FilterStageMetadata
+from src.graph.config import graph_config
 from src.graph.models import AssembledGraphData, CommunicationData, EntityInTopic, GraphContext, SpeakerNode, TopicGroup
 from src.shared.data_loaders import DataLoader
 from src.shared.models import ContentType
 from src.shared.pipeline_definitions import PipelineStages
 from src.scrape.models import ScrapingResult
-from src.speakers import SPEAKERS_FILE
-from src.speakers.models import SpeakerRegistry
+from src.speakers.registry import load_speaker_registry
 from src.summarize.models import SummarizationResult
 from src.utils.logging_utils import get_logger
 
@@ -37,20 +38,28 @@ class GraphDataAssembler:
             topics=topics,
         )
 
-    def _load_categorization(self, file_paths: Dict[str, str]) -> CategorizationResult:
-        """Load categorization stage output."""
+    @staticmethod
+    def _load_output(path: str, model: type[BaseModel]) -> Dict[str, Any]:
+        """Load a stage artifact as a dict; it was validated on write, so re-validate only in strict mode."""
+        output = DataLoader.load(path)
+        if graph_config.STRICT_VALIDATION:
+            model.model_validate(output)
+        return output
+
+    def _load_categorization(self, file_paths: Dict[str, str]) -> Dict[str, Any]:
+        """Load categorization stage output data (entities and topic summaries)."""
         categorize_path = file_paths.get(PipelineStages.CATEGORIZE.value)
-        return CategorizationResult.model_validate(DataLoader.load(categorize_path))
+        return self._load_output(categorize_path, CategorizationResult).get("data") or {}
 
     def _load_communication(
         self, file_paths: Dict[str, str], context: GraphContext
     ) -> CommunicationData:
         """Load communication data by stitching stage outputs and metadata."""
         scrape_path = file_paths.get(PipelineStages.SCRAPE.value)
-        scrape_output = DataLoader.load(scrape_path)
-        scraping_result = ScrapingResult.model_validate(scrape_output)
-        scrape_content = scraping_result.data.scrape if scraping_result.data else ""
-        word_count = scraping_result.data.word_count if scraping_result.data else 0
+        scrape_output = self._load_output(scrape_path, ScrapingResult)
+        scrape_data = scrape_output.get("data") or {}
+        scrape_content = scrape_data.get("scrape", "")
+        word_count = scrape_data.get("word_count", 0)
 
         title = context.title or "Unknown"
         content_date = context.publication_date or "Unknown"
@@ -68,13 +77,13 @@ class GraphDataAssembler:
         compression_ratio = 1.0
 
         if summarize_path:
-            summarization_result = SummarizationResult.model_validate(DataLoader.load(summarize_path))
-            if summarization_result.data:
-                compression_ratio = summarization_result.data.compression_of_original
+            summarize_data = self._load_output(summarize_path, SummarizationResult).get("data")
+            if summarize_data:
+                compression_ratio = summarize_data["compression_of_original"]
                 was_summarized = compression_ratio < 1.0
 
         return CommunicationData(
-            id=scraping_result.id,
+            id=scrape_output["id"],
             title=title,
             content_type=content_type,
             content_date=content_date,
@@ -90,8 +99,7 @@ class GraphDataAssembler:
         if not matched_speakers:
             raise ValueError("No matched speakers provided")
 
-        with open(SPEAKERS_FILE) as f:
-            registry = SpeakerRegistry(**json.load(f))
+        registry = load_speaker_registry()
 
         results = []
         for display_name in matched_speakers:
@@ -113,11 +121,10 @@ class GraphDataAssembler:
             raise ValueError(f"None of the matched speakers found in registry: {matched_speakers}")
         return results
 
-    def _build_topic_groups(self, comm_id: str, categorization: CategorizationResult) -> List[TopicGroup]:
+    def _build_topic_groups(self, comm_id: str, categorization: Dict[str, Any]) -> List[TopicGroup]:
         """Group entities and claims by (speaker, topic) — topic-first structure."""
-        cat = categorization.data or CategorizationOutput(entities=[])
-        entities = [e.model_dump(mode='json') for e in cat.entities]
-        summary_lookup = {(ts.speaker, ts.topic): ts.summary for ts in cat.topics}
+        entities = categorization.get("entities", [])
+        summary_lookup = {(ts["speaker"], ts["topic"]): ts["summary"] for ts in categorization.get("topics", [])}
 
         topics_map: Dict[tuple, Dict] = {}
         for entity in entities:
@@ -1,9 +1,10 @@
 """Neo4j write operations for graph loading."""
 
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, List, Tuple
 
 from src.graph.config import graph_config
-from src.graph.models import AssembledGraphData, EntityInTopic, GraphLoadStats, TopicGroup
+from src.graph.models import AssembledGraphData, GraphLoadStats, TopicGroup
 from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +13,77 @@ logger = get_logger(__name__)
 class Neo4jLoader:
     """Loads assembled graph data into Neo4j."""
 
+    # Constraints are created once per process rather than on every item
+    _schema_ready = False
+    _schema_lock = threading.Lock()
+
+    _CONSTRAINTS = (
+        "CREATE CONSTRAINT speaker_id IF NOT EXISTS FOR (s:Speaker) REQUIRE s.speaker_id IS UNIQUE",
+        "CREATE CONSTRAINT communication_id IF NOT EXISTS FOR (c:Communication) REQUIRE c.id IS UNIQUE",
+        "CREATE CONSTRAINT entity_name IF NOT EXISTS FOR (e:Entity) REQUIRE e.entity_name IS UNIQUE",
+        "CREATE CONSTRAINT topic_id IF NOT EXISTS FOR (t:Topic) REQUIRE t.topic_id IS UNIQUE",
+        "CREATE CONSTRAINT claim_id IF NOT EXISTS FOR (cl:Claim) REQUIRE cl.claim_id IS UNIQUE",
+    )
+
+    _COMMUNICATION_QUERY = """
+    MERGE (c:Communication {id: $id})
+    ON CREATE SET c.full_text = $full_text,
+        c.word_count = $word_count
+    SET c.name = $title,
+        c.title = $title,
+        c.content_type = $content_type,
+        c.content_date = $content_date,
+        c.source_url = $source_url,
+        c.was_summarized = $was_summarized,
+        c.compression_ratio = $compression_ratio
+    WITH c
+    UNWIND $speakers AS sp
+    MERGE (s:Speaker {speaker_id: sp.speaker_id})
+    SET s.name = sp.name,
+        s.role = sp.role,
+        s.organization = sp.organization,
+        s.industry = sp.industry,
+        s.region = sp.region
+    MERGE (s)-[:DELIVERED]->(c)
+    RETURN count(s) AS loaded
+    """
+
+    _TOPICS_QUERY = """
+    MATCH (c:Communication {id: $comm_id})
+    UNWIND $rows AS row
+    MERGE (t:Topic {topic_id: row.topic_id})
+    SET t.name = row.topic,
+        t.topic = row.topic,
+        t.speaker = row.speaker,
+        t.topic_summary = row.topic_summary
+    MERGE (c)-[:HAS_TOPIC]->(t)
+    RETURN count(t) AS loaded
+    """
+
+    _ENTITIES_QUERY = """
+    UNWIND $rows AS row
+    MATCH (t:Topic {topic_id: row.topic_id})
+    MERGE (e:Entity {entity_name: row.entity_name})
+    SET e.name = row.entity_name,
+        e.entity_type = row.entity_type
+    MERGE (t)-[:HAS_ENTITY]->(e)
+    RETURN count(e) AS loaded
+    """
+
+    _CLAIMS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (:Topic {topic_id: row.topic_id})-[:HAS_ENTITY]->(e:Entity {entity_name: row.entity_name})
+    MERGE (cl:Claim {claim_id: row.claim_id})
+    SET cl.name = row.claim_label,
+        cl.speaker = row.speaker,
+        cl.topic = row.topic,
+        cl.sentiment = row.sentiment,
+        cl.summary = row.summary,
+        cl.passages = row.passages
+    MERGE (e)-[:HAS_CLAIM]->(cl)
+    RETURN count(cl) AS loaded
+    """
+
     def __init__(self, driver: Any) -> None:
         self.driver = driver
 
@@ -28,174 +100,123 @@ class Neo4jLoader:
             raise
 
     def _load_data(self, session: Any, data: AssembledGraphData) -> GraphLoadStats:
-        stats = GraphLoadStats()
-        self._create_constraints(session)
-
-        comm_dict = data.communication.model_dump()
-        for speaker in data.speakers:
-            s = self._load_speaker_node(session, speaker.model_dump())
-            stats.nodes_created += s.nodes_created
-            c = self._load_communication_node(session, comm_dict, speaker.speaker_id)
-            stats.nodes_created += c.nodes_created
-            stats.relationships_created += c.relationships_created
-
-        t = self._load_topics(session, data.id, data.topics)
-        stats.nodes_created += t.nodes_created
-        stats.relationships_created += t.relationships_created
+        """Write one communication's graph.
+
+        Normally the whole document commits in one managed write transaction. Only when a topic, entity or
+        claim row list exceeds UNWIND_BATCH_SIZE does the communication commit first and each UNWIND chunk
+        commit in its own transaction, so an oversized document cannot grow one transaction without bound.
+        """
+        # Schema changes cannot share a transaction with data writes, so constraints run on the session first
+        self._ensure_schema(session)
+        levels = self._topic_levels(data.id, data.topics)
+        batch_size = graph_config.UNWIND_BATCH_SIZE
+        if all(len(rows) <= batch_size for _, rows, _ in levels):
+            return session.execute_write(self._write_document, data, levels)
+
+        # Oversized document: client-side chunking, one transaction per chunk, rather than apoc.periodic.iterate
+        # (APOC is not installed here)
+        stats = session.execute_write(self._load_communication, data)
+        for query, rows, params in levels:
+            for i in range(0, len(rows), batch_size):
+                loaded = session.execute_write(self._run_batch, query, rows[i:i + batch_size], params)
+                stats.nodes_created += loaded
+                stats.relationships_created += loaded
+        return stats
+
+    def _write_document(
+        self, tx: Any, data: AssembledGraphData, levels: List[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]]
+    ) -> GraphLoadStats:
+        """Write the communication and every topic, entity and claim level in the caller's transaction."""
+        stats = self._load_communication(tx, data)
+        for query, rows, params in levels:
+            if rows:
+                loaded = self._run_batch(tx, query, rows, params)
+                stats.nodes_created += loaded
+                stats.relationships_created += loaded
         return stats
 
     def _create_stats(self, nodes: int = 0, relationships: int = 0) -> GraphLoadStats:
         return GraphLoadStats(nodes_created=nodes, relationships_created=relationships)
 
-    def _create_constraints(self, session: Any) -> None:
-        constraints = [
-            "CREATE CONSTRAINT speaker_id IF NOT EXISTS FOR (s:Speaker) REQUIRE s.speaker_id IS UNIQUE",
-            "CREATE CONSTRAINT communication_id IF NOT EXISTS FOR (c:Communication) REQUIRE c.id IS UNIQUE",
-            "CREATE CONSTRAINT entity_name IF NOT EXISTS FOR (e:Entity) REQUIRE e.entity_name IS UNIQUE",
-            "CREATE CONSTRAINT topic_id IF NOT EXISTS FOR (t:Topic) REQUIRE t.topic_id IS UNIQUE",
-        ]
-        for constraint in constraints:
+    @classmethod
+    def _ensure_schema(cls, session: Any) -> None:
+        if cls._schema_ready:
+            return
+        with cls._schema_lock:
+            if not cls._schema_ready:
+                cls._create_constraints(session)
+                cls._schema_ready = True
+
+    @classmethod
+    def _create_constraints(cls, session: Any) -> None:
+        for constraint in cls._CONSTRAINTS:
             try:
                 session.run(constraint)
             except Exception as e:
                 logger.debug(f"Constraint already exists or error: {e}")
 
-    def _load_speaker_node(self, session: Any, speaker: Dict[str, Any]) -> GraphLoadStats:
-        query = """
-        MERGE (s:Speaker {speaker_id: $speaker_id})
-        SET s.name = $name,
-            s.role = $role,
-            s.organization = $organization,
-            s.industry = $industry,
-            s.region = $region
-        RETURN s
+    def _load_communication(self, tx: Any, data: AssembledGraphData) -> GraphLoadStats:
+        """MERGE the Communication and every speaker with its DELIVERED edge in a single round-trip."""
+        speakers = [speaker.model_dump() for speaker in data.speakers]
+        loaded = tx.run(
+            self._COMMUNICATION_QUERY, speakers=speakers, **data.communication.model_dump()
+        ).single()["loaded"]
+        # One Speaker plus one Communication node and one DELIVERED edge per speaker, as counted before
+        return self._create_stats(nodes=2 * loaded, relationships=loaded)
+
+    def _topic_levels(
+        self, comm_id: str, topics: List[TopicGroup]
+    ) -> List[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]]:
+        """Flatten topics, entities and claims into (query, UNWIND rows, params) levels, loaded in order.
+
+        Each level MATCHes its parent, so rows under a topic or entity that failed to load are skipped.
         """
-        result = session.run(query, **speaker)
-        return self._create_stats(nodes=1 if result.single() else 0)
+        topic_rows: List[Dict[str, Any]] = []
+        entity_rows: List[Dict[str, Any]] = []
+        claim_rows: List[Dict[str, Any]] = []
+        for topic in topics:
+            topic_rows.append({
+                "topic_id": topic.topic_id,
+                "topic": topic.topic,
+                "speaker": topic.speaker,
+                "topic_summary": topic.topic_summary,
+            })
+            for entity in topic.entities:
+                entity_rows.append({
+                    "topic_id": topic.topic_id,
+                    "entity_name": entity.entity_name,
+                    "entity_type": entity.entity_type,
+                })
+                claim_rows.extend(
+                    self._claim_row(topic.topic_id, entity.entity_name, i, claim)
+                    for i, claim in enumerate(entity.claims)
+                )
+        return [
+            (self._TOPICS_QUERY, topic_rows, {"comm_id": comm_id}),
+            (self._ENTITIES_QUERY, entity_rows, {}),
+            (self._CLAIMS_QUERY, claim_rows, {}),
+        ]
 
-    def _load_communication_node(
-        self, session: Any, communication: Dict[str, Any], speaker_id: str
-    ) -> GraphLoadStats:
-        query = """
-        MATCH (s:Speaker {speaker_id: $speaker_id})
-        MERGE (c:Communication {id: $id})
-        SET c.name = $title,
-            c.title = $title,
-            c.content_type = $content_type,
-            c.content_date = $content_date,
-            c.source_url = $source_url,
-            c.full_text = $full_text,
-            c.word_count = $word_count,
-            c.was_summarized = $was_summarized,
-            c.compression_ratio = $compression_ratio
-        MERGE (s)-[r:DELIVERED]->(c)
-        RETURN c, r
-        """
-        result = session.run(query, **{**communication, "speaker_id": speaker_id})
-        record = result.single()
-        return self._create_stats(nodes=1 if record else 0, relationships=1 if record else 0)
+    @staticmethod
+    def _run_batch(tx: Any, query: str, rows: List[Dict[str, Any]], params: Dict[str, Any]) -> int:
+        """Run one UNWIND statement in the given transaction; returns the number of rows loaded."""
+        return tx.run(query, rows=rows, **params).single()["loaded"]
 
-    def _load_topics(
-        self, session: Any, comm_id: str, topics: List[TopicGroup]
-    ) -> GraphLoadStats:
-        nodes = relationships = 0
-        for topic in topics:
-            s = self._load_topic_group(session, comm_id, topic)
-            nodes += s.nodes_created
-            relationships += s.relationships_created
-        return self._create_stats(nodes=nodes, relationships=relationships)
+    @staticmethod
+    def _claim_row(topic_id: str, entity_name: str, index: int, claim: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a claim into an UNWIND row keyed by its parent topic and entity.
 
-    def _load_topic_group(
-        self, session: Any, comm_id: str, topic: TopicGroup
-    ) -> GraphLoadStats:
-        """MERGE Topic node per (comm, speaker, topic), link to Communication."""
-        query = """
-        MATCH (c:Communication {id: $comm_id})
-        MERGE (t:Topic {topic_id: $topic_id})
-        SET t.name = $topic,
-            t.topic = $topic,
-            t.speaker = $speaker,
-            t.topic_summary = $topic_summary
-        MERGE (c)-[:HAS_TOPIC]->(t)
-        RETURN t
-        """
-        result = session.run(
-            query,
-            comm_id=comm_id,
-            topic_id=topic.topic_id,
-            topic=topic.topic,
-            speaker=topic.speaker,
-            topic_summary=topic.topic_summary,
-        )
-        if not result.single():
-            return self._create_stats()
-
-        nodes_created = 1
-        relationships_created = 1
-
-        for entity in topic.entities:
-            s = self._load_entity_in_topic(session, topic.topic_id, entity)
-            nodes_created += s.nodes_created
-            relationships_created += s.relationships_created
-
-        return self._create_stats(nodes=nodes_created, relationships=relationships_created)
-
-    def _load_entity_in_topic(
-        self, session: Any, topic_id: str, entity: EntityInTopic
-    ) -> GraphLoadStats:
-        """MERGE global Entity node, link to Topic, then load claims on Entity."""
-        query = """
-        MATCH (t:Topic {topic_id: $topic_id})
-        MERGE (e:Entity {entity_name: $entity_name})
-        SET e.name = $entity_name,
-            e.entity_type = $entity_type
-        MERGE (t)-[:HAS_ENTITY]->(e)
-        RETURN e
-        """
-        result = session.run(
-            query,
-            topic_id=topic_id,
-            entity_name=entity.entity_name,
-            entity_type=entity.entity_type,
-        )
-        if not result.single():
-            return self._create_stats()
-
-        nodes_created = 1
-        relationships_created = 1
-
-        for claim in entity.claims:
-            s = self._load_claim_node(session, entity.entity_name, claim)
-            nodes_created += s.nodes_created
-            relationships_created += s.relationships_created
-
-        return self._create_stats(nodes=nodes_created, relationships=relationships_created)
-
-    def _load_claim_node(
-        self, session: Any, entity_name: str, claim: Dict[str, Any]
-    ) -> GraphLoadStats:
-        """Create Claim node attached to Entity."""
-        query = """
-        MATCH (e:Entity {entity_name: $entity_name})
-        CREATE (cl:Claim {
-            name: $claim_label,
-            speaker: $speaker,
-            topic: $topic,
-            sentiment: $sentiment,
-            summary: $summary,
-            passages: $passages
-        })
-        CREATE (e)-[:HAS_CLAIM]->(cl)
-        RETURN cl
+        claim_id is deterministic for a given categorize artifact, so re-running a load MERGEs the same claims
+        instead of creating duplicates.
         """
-        result = session.run(
-            query,
-            entity_name=entity_name,
-            claim_label=claim["claim_label"],
-            speaker=claim["speaker"],
-            topic=claim["topic"],
-            sentiment=claim["sentiment"],
-            summary=claim["summary"],
-            passages=claim["passages"],
-        )
-        return self._create_stats(nodes=1 if result.single() else 0, relationships=1)
+        return {
+            "claim_id": f"{topic_id}__{entity_name}__{index}",
+            "topic_id": topic_id,
+            "entity_name": entity_name,
+            "claim_label": claim["claim_label"],
+            "speaker": claim["speaker"],
+            "topic": claim["topic"],
+            "sentiment": claim["sentiment"],
+            "summary": claim["summary"],
+            "passages": claim["passages"],
+        }
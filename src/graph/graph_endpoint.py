@@ -5,7 +5,7 @@ Graph endpoint for loading data into Neo4j.
 from src.shared.base_endpoint import BaseEndpoint
 from src.shared.pipeline_definitions import EndpointResponse, PipelineStages, PipelineState
 from src.graph.pipeline import load_to_graph
-from src.graph.models import GraphContext, GraphResult
+from src.graph.models import GraphContext
 
 
 class GraphEndpoint(BaseEndpoint):
@@ -28,11 +28,11 @@ class GraphEndpoint(BaseEndpoint):
         # Execute graph loading pipeline - returns StageResult
         stage_result = load_to_graph(processing_context)
 
-        # Parse artifact using GraphResult model
-        graph_result = GraphResult.model_validate(stage_result.artifact)
+        # Artifact was built in-process from a validated GraphLoadStats; read it without re-validating
+        stats = stage_result.artifact["data"]
 
         self.logger.debug(
-            f"Successfully loaded item {state.id} to Neo4j - {graph_result.data.nodes_created} nodes, {graph_result.data.relationships_created} relationships"
+            f"Successfully loaded item {state.id} to Neo4j - {stats['nodes_created']} nodes, {stats['relationships_created']} relationships"
         )
 
         return self._success(stage_result, PipelineStages.GRAPH)
@@ -4,6 +4,8 @@ Grapher for assembling and loading data into Neo4j.
 Orchestrates data assembly and Neo4j ingestion.
 """
 
+import atexit
+import threading
 from typing import Any
 
 from neo4j import GraphDatabase
@@ -11,13 +13,35 @@ from neo4j import GraphDatabase
 from src.graph.config import graph_config
 from src.graph.engine.data_assembler import GraphDataAssembler
 from src.graph.engine.neo4j_loader import Neo4jLoader
-from src.graph.models import GraphContext, GraphLoadStats, GraphResult
+from src.graph.models import GraphContext, GraphLoadStats
 from src.shared.pipeline_definitions import StageResult
 from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
 
+_driver: Any = None
+_driver_lock = threading.Lock()
+
+
+def get_driver() -> Any:
+    """Process-wide Neo4j driver so items reuse its connection pool instead of reconnecting; closed at exit.
+
+    Created under a lock: with GRAPH_MAX_WORKERS > 1, concurrent first calls must not each build (and leak) a driver.
+    """
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                driver = GraphDatabase.driver(
+                    graph_config.NEO4J_URI,
+                    auth=(graph_config.NEO4J_USER, graph_config.NEO4J_PASSWORD),
+                )
+                atexit.register(driver.close)
+                _driver = driver
+    return _driver
+
+
 class Grapher:
     """
     Grapher implementation for loading data into Neo4j knowledge graph.
@@ -31,17 +55,13 @@ class Grapher:
         logger.debug("Grapher initialized")
 
     def __enter__(self) -> "Grapher":
-        """Context manager entry - establish Neo4j connection."""
-        self.driver = GraphDatabase.driver(
-            graph_config.NEO4J_URI,
-            auth=(graph_config.NEO4J_USER, graph_config.NEO4J_PASSWORD),
-        )
+        """Context manager entry - attach the shared Neo4j driver."""
+        self.driver = get_driver()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Context manager exit - close Neo4j connection."""
-        if self.driver:
-            self.driver.close()
+        """Context manager exit - release the driver; the shared pool stays open until process exit."""
+        self.driver = None
 
     def load_graph(self, processing_context: GraphContext) -> StageResult:
         """Load data into Neo4j from processing context."""
@@ -56,15 +76,18 @@ class Grapher:
         return self._create_result(id, stats)
 
     def _create_result(self, id: str, stats: GraphLoadStats) -> StageResult:
-        """Create StageResult with separated artifact and metadata."""
-        artifact = GraphResult(
-            id=id,
-            success=True,
-            data=stats,
-            error_message=None,
-        )
+        """Create StageResult with separated artifact and metadata.
+
+        The artifact is written directly in GraphResult's dumped shape; stats is already a validated model.
+        """
+        artifact = {
+            "id": id,
+            "success": True,
+            "data": stats.model_dump(),
+            "error_message": None,
+        }
         logger.debug(
             f"Successfully loaded {id} to Neo4j: {stats.nodes_created} nodes, "
             f"{stats.relationships_created} relationships"
         )
-        return StageResult(artifact=artifact.model_dump(mode='json'), metadata={})
+        return StageResult(artifact=artifact, metadata={})
@@ -2,9 +2,10 @@
 Simple data loader for pipeline stages.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict
+
+import orjson
 import pyprojroot
 
 from src.utils.logging_utils import get_logger
@@ -24,9 +25,8 @@ class DataLoader:
             path = pyprojroot.here() / path
         logger.debug(f"Loading data from {path}")
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {path}: {e}")
 
     @staticmethod
@@ -5,8 +5,11 @@ Provides common patterns for processing items through pipeline stages with
 consistent error handling, persistence, and state management.
 """
 
+import queue
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Tuple
+
+from prefect.futures import PrefectFuture
 
 from tasks.orchestration import get_items
 from src.shared.pipeline_definitions import (
@@ -15,7 +18,7 @@ from src.shared.pipeline_definitions import (
     PipelineStages,
     PipelineState,
 )
-from src.shared.pipeline_state import PipelineStateManager
+from src.shared.pipeline_state import PipelineStateManager, get_state_manager
 from src.shared.persistence import save_data
 from src.utils.logging_utils import get_logger
 
@@ -27,27 +30,53 @@ class FlowProcessor:
         self.flow_name = flow_name
         self.logger = get_logger(flow_name)
     
-    def process_items(self, stage: PipelineStages, task_func: Callable[..., Any]) -> None:
-        """Process items through a pipeline stage with consistent error handling."""
+    def process_items(self, stage: PipelineStages, task_func: Callable[..., Any],
+                      max_concurrency: int = 1) -> None:
+        """Process items through a pipeline stage with consistent error handling.
+
+        Up to max_concurrency tasks run at once; the next item is submitted as each one finishes, and
+        results are recorded on this thread in completion order.
+        """
         items = get_items(stage)
         self.logger.info(f"Found {len(items)} items to process for stage {stage}")
         
-        manager = PipelineStateManager()
-        
-        for i, item in enumerate(items, 1):
-            self.logger.info(f"Processing item {i}/{len(items)}: {item.id}")
-            self._process_single_item(item, task_func, stage, manager)
+        manager = get_state_manager()
+        remaining = iter(enumerate(items, 1))
+        pending: Dict[PrefectFuture, Tuple[PipelineState, float]] = {}
+        # Done callbacks push (future, finish time) here; one long-lived queue instead of a new waiter per result
+        done: "queue.Queue[Tuple[PrefectFuture, float]]" = queue.Queue()
+
+        def submit_next() -> None:
+            # Items whose submit raises are recorded as failed and the next one is tried
+            for i, item in remaining:
+                self.logger.info(f"Processing item {i}/{len(items)}: {item.id}")
+                submitted_at = time.time()
+                try:
+                    future = task_func.submit(item)
+                except Exception as e:
+                    self._record_failure(item, e, time.time() - submitted_at, stage, manager)
+                    continue
+                pending[future] = (item, submitted_at)
+                # Stamp completion when the task finishes, so time spent waiting on other items is not charged to it
+                future.add_done_callback(lambda _, f=future: done.put((f, time.time())))
+                return
+
+        for _ in range(max(1, max_concurrency)):
+            submit_next()
+        while pending:
+            future, finished_at = done.get()
+            state, submitted_at = pending.pop(future)
+            self._process_single_item(state, future, finished_at - submitted_at, stage, manager)
+            submit_next()
         
         self.logger.info(f"Completed {self.flow_name} for {len(items)} items")
     
-    def _process_single_item(self, state: PipelineState, task_func: Callable[..., Any],
+    def _process_single_item(self, state: PipelineState, future: PrefectFuture, elapsed: float,
                              stage: PipelineStages, manager: PipelineStateManager) -> None:
-        """Process a single item with error handling and state management."""
-        start_time = time.time()
+        """Record a finished item's result with error handling and state management."""
+        elapsed = max(0.01, elapsed)
         try:
-            result = task_func.submit(state)
-            result_data = result.result()
-            elapsed = max(0.01, time.time() - start_time)
+            result_data = future.result()
             result_data = result_data.model_copy(update={'processing_time_seconds': round(elapsed, 2)})
             output_file = save_data(state, result_data.output, stage.value)
             
@@ -61,10 +90,15 @@ class FlowProcessor:
             self.logger.debug(f"Successfully completed {stage} for item {state.id} -> {output_file}")
                 
         except Exception as e:
-            elapsed = max(0.01, time.time() - start_time)
-            self.logger.error(f"Error processing item {state.id} in {stage}: {str(e)}")
-            manager.record_stage_result(
-                status=PipelineStageStatus.FAILED,
-                result_data=EndpointResponse.for_error(state.id, stage.value, str(e), elapsed),
-                article_fields=state.article_fields(),
-            )
+            self._record_failure(state, e, elapsed, stage, manager)
+    
+    def _record_failure(self, state: PipelineState, error: Exception, elapsed: float,
+                        stage: PipelineStages, manager: PipelineStateManager) -> None:
+        """Log a failed item and record it as FAILED in the pipeline state."""
+        elapsed = max(0.01, elapsed)
+        self.logger.error(f"Error processing item {state.id} in {stage}: {str(error)}")
+        manager.record_stage_result(
+            status=PipelineStageStatus.FAILED,
+            result_data=EndpointResponse.for_error(state.id, stage.value, str(error), elapsed),
+            article_fields=state.article_fields(),
+        )
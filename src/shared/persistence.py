@@ -5,11 +5,11 @@ Implements unified hierarchical file structure across all stages:
 {date}/{source_slug}/{id}/{stage}.json
 """
 
-import json
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse
 
+import orjson
 import pyprojroot
 
 from src.config import config
@@ -46,9 +46,19 @@ def save_data(context: Any, data: Any, stage: str) -> str:
     file_path = Path(config.DATA_ROOT) / date / _source_slug(url) / context.id / f"{stage}.json"
 
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
     relative_path = file_path.relative_to(pyprojroot.here())
     logger.debug(f"Saved {stage} data to {relative_path}")
     return str(relative_path).replace('\\', '/')
+
+
+def delete_data(file_path: str) -> None:
+    """Remove a file written by save_data (path as returned by it), pruning its item directory if left empty."""
+    path = pyprojroot.here() / file_path
+    path.unlink(missing_ok=True)
+    try:
+        path.parent.rmdir()
+    except OSError:
+        pass
+    logger.debug(f"Deleted {file_path}")
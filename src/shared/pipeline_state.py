@@ -1,9 +1,10 @@
 """Pipeline state management backed by SQLite via Peewee ORM."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable
 
 from peewee import SqliteDatabase, Model, CharField, IntegerField, FloatField, TextField, CompositeKey
 
@@ -61,6 +62,8 @@ class PipelineStateManager:
         (PipelineStageStatus.COMPLETED.value, PipelineStageStatus.FILTERED.value)
     )
     _STAGE_ROW_FIELDS = frozenset(PipelineStage._meta.fields.keys())
+    # Stay under SQLite's bound-parameter limit (999 on older builds)
+    _SQLITE_MAX_VARS = 900
 
     @staticmethod
     def _filter_row_fields(data: dict[str, Any]) -> dict[str, Any]:
@@ -76,8 +79,12 @@ class PipelineStateManager:
         db.create_tables([PipelineStage], safe=True)
 
     def record_discover_result(
-        self, discovered: DiscoveredArticle, run_timestamp: str, file_path: str) -> None:
-        """Record discover stage result for a newly discovered article."""
+        self, discovered: DiscoveredArticle, run_timestamp: str, file_path: str,
+        data: dict[str, Any] | None = None) -> None:
+        """Record discover stage result for a newly discovered article.
+
+        Pass data when the caller already has discovered.model_dump(mode='json') to avoid dumping twice.
+        """
         now = datetime.now().isoformat()
         result_data = EndpointResponse(
             success=True,
@@ -85,7 +92,7 @@ class PipelineStateManager:
             output=StageOperationResult(
                 id=discovered.id,
                 success=True,
-                data=discovered.model_dump(mode='json'),
+                data=data if data is not None else discovered.model_dump(mode='json'),
                 error_message=None,
             ).model_dump(mode='json'),
             state_update=None,
@@ -104,6 +111,13 @@ class PipelineStateManager:
             ),
         )
 
+    def record_discover_results(
+        self, records: Iterable[tuple[DiscoveredArticle, str, dict[str, Any]]], run_timestamp: str) -> None:
+        """Record (article, file_path, dumped data) discover results in one transaction instead of one commit per row."""
+        with db.atomic():
+            for discovered, file_path, data in records:
+                self.record_discover_result(discovered, run_timestamp, file_path, data=data)
+
     def record_stage_result(self, status: PipelineStageStatus, result_data: EndpointResponse,
                             file_path: str | None = None,
                             article_fields: ArticleFields | None = None) -> None:
@@ -172,6 +186,18 @@ class PipelineStateManager:
         ).first()
         return self._build_state(row.article_id) if row else None
 
+    def get_existing_source_urls(self, source_urls: Iterable[str]) -> set[str]:
+        """Return the subset of source_urls already tracked, using chunked IN queries instead of one lookup per URL."""
+        urls = list(set(source_urls))
+        existing: set[str] = set()
+        for i in range(0, len(urls), self._SQLITE_MAX_VARS):
+            chunk = urls[i:i + self._SQLITE_MAX_VARS]
+            query = PipelineStage.select(PipelineStage.source_url).where(
+                PipelineStage.source_url.in_(chunk)
+            ).distinct()
+            existing.update(row.source_url for row in query)
+        return existing
+
     def _query_states(self, next_stage: str | None = None) -> list[PipelineState]:
         rows = PipelineStage.select(PipelineStage.article_id).distinct()
         return [
@@ -259,3 +285,9 @@ class PipelineStateManager:
             retry_count=total_retries,
             stages=stages,
         )
+
+
+@lru_cache(maxsize=1)
+def get_state_manager() -> PipelineStateManager:
+    """Process-wide PipelineStateManager; the DB is initialized and its table ensured only once."""
+    return PipelineStateManager()
@@ -1,13 +1,25 @@
 """Speaker registry utilities."""
 
-import json
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
 
 from src.speakers import SPEAKERS_FILE
 from src.speakers.models import SpeakerRegistry
 
 
+@lru_cache(maxsize=4)
+def _load_registry(path: str, mtime: float) -> SpeakerRegistry:
+    """Parse and validate a speakers file; mtime is part of the key so edits are picked up."""
+    return SpeakerRegistry(**orjson.loads(Path(path).read_bytes()))
+
+
+def load_speaker_registry() -> SpeakerRegistry:
+    """SpeakerRegistry from speakers.json, parsed once per file version. Treat as read-only."""
+    return _load_registry(str(SPEAKERS_FILE), SPEAKERS_FILE.stat().st_mtime)
+
+
 def get_tracked_display_names() -> list[str]:
     """Display names from speakers.json."""
-    with open(SPEAKERS_FILE) as f:
-        registry = SpeakerRegistry(**json.load(f))
-    return list(registry.speakers)
+    return list(load_speaker_registry().speakers)
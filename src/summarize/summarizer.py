@@ -45,14 +45,15 @@ class Summarizer:
         original_tokens = len(self.tokenizer.encode(text))
         
         if not text or not text.strip():
-            return self._create_result(id, text, "", 0.0)
+            return self._create_result(id, "", 0.0, 0, 0)
         
         summary_text = text if original_tokens <= target_tokens else self._do_summarization(text, target_tokens)
-        orig_words = len(text.split()) if text else 0
-        sum_words = len(summary_text.split()) if summary_text else 0
+        # Word counts are computed once here and reused by _create_result; an unsummarized text reuses its own count
+        orig_words = len(text.split())
+        sum_words = orig_words if summary_text is text else len(summary_text.split())
         compression_of_original = sum_words / orig_words if orig_words else 1.0
         output_text = None if compression_of_original >= 1.0 else summary_text
-        return self._create_result(id, text, output_text, compression_of_original)
+        return self._create_result(id, output_text, compression_of_original, orig_words, sum_words)
 
     
     def _do_summarization(self, text: str, target_tokens: int) -> str:
@@ -122,11 +123,10 @@ class Summarizer:
         return final_scores
     
     def _create_result(
-        self, id: str, original: str, summary: Optional[str], compression_of_original: float
+        self, id: str, summary: Optional[str], compression_of_original: float,
+        orig_words: int, sum_words: int
     ) -> StageResult:
         """Helper to create StageResult with separated artifact and metadata."""
-        orig_words = len(original.split())
-        sum_words = len(summary.split()) if summary else 0
         summarization_data = SummarizationData(
             summarize=summary,
             compression_of_original=compression_of_original,
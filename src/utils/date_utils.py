@@ -0,0 +1,24 @@
+"""Date parsing utilities."""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_date(date_str: str) -> date:
+    """
+    Parse a YYYY-MM-DD string into a date, memoized on the input string.
+
+    Uses strptime rather than date.fromisoformat so non-zero-padded dates like "2024-1-5"
+    are still accepted and basic/week forms like "20240105" are still rejected.
+
+    Args:
+        date_str: Date in %Y-%m-%d format
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If the string does not match %Y-%m-%d
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
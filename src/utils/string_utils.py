@@ -3,6 +3,9 @@
 import re
 from typing import Optional
 
+_NON_SLUG_CHARS = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATORS = re.compile(r'[-\s]+')
+
 
 def slugify(text: str, max_length: Optional[int] = None) -> str:
     """
@@ -22,7 +25,7 @@ def slugify(text: str, max_length: Optional[int] = None) -> str:
         'trump-announces-new'
     """
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _NON_SLUG_CHARS.sub('', text)
+    text = _SLUG_SEPARATORS.sub('-', text)
     slug = text.strip('-')
     return slug[:max_length] if max_length else slug
@@ -6,7 +6,7 @@ Provides clean task orchestration using stage-specific processors.
 
 from typing import List
 
-from src.shared.pipeline_state import PipelineStateManager
+from src.shared.pipeline_state import get_state_manager
 from src.shared.pipeline_definitions import PipelineState, PipelineStages
 from src.utils.logging_utils import get_logger
 
@@ -15,5 +15,4 @@ logger = get_logger(__name__)
 
 def get_items(stage: PipelineStages) -> List[PipelineState]:
     """Get items needing processing for a stage."""
-    manager = PipelineStateManager()
-    return manager.get_states_for_stage(stage)
\ No newline at end of file
+    return get_state_manager().get_states_for_stage(stage)
\ No newline at end of file